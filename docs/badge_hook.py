@@ -7,6 +7,10 @@ from mkdocs.config.defaults import MkDocsConfig
 from mkdocs.structure.files import Files
 from mkdocs.structure.pages import Page
 
+BADGE_SYNTAX = re.compile(r"<!-- md:(\w+) (.*) -->", flags=re.IGNORECASE | re.MULTILINE)
+
+PERMISSION_SPEC = re.compile(r"([^#]+)(.*)")
+
 
 def on_page_markdown(markdown: str, *, page: Page, config: MkDocsConfig, files: Files):
     # Replace callback
@@ -26,9 +30,7 @@ def on_page_markdown(markdown: str, *, page: Page, config: MkDocsConfig, files:
         raise RuntimeError(f"Unknown badge type: {badge_type}")
 
     # Find and replace all external asset URLs in current page
-    return re.sub(
-        r"<!-- md:(\w+) (.*) -->", replace, markdown, flags=re.IGNORECASE | re.MULTILINE
-    )
+    return BADGE_SYNTAX.sub(replace, markdown)
 
 
 # -----------------------------------------------------------------------------
@@ -57,7 +59,7 @@ def _badge(icon: str, text: str = ""):
 def _badge_for_version(text: str, page: Page, files: Files):
     icon = "material-tag-outline"
     repo = "cpp-linter/cpp-linter-rs"
-    version = tuple(int(x.lstrip("v")) for x in text.split("."))
+    version = tuple(map(int, text.lstrip("v").split(".")))
     if version < (1, 4, 6):
         repo = "cpp-linter/cpp-linter-action"
     elif version[0] == 1:
@@ -78,7 +80,7 @@ def _badge_for_default(text: str, page: Page, files: Files):
 
 # Create badge for required value flag
 def _badge_for_permissions(args: str, page: Page, files: Files):
-    match_permission = re.match(r"([^#]+)(.*)", args)
+    match_permission = PERMISSION_SPEC.match(args)
     if match_permission is None:
         raise ValueError(f"failed to parse permissions from {args}")
     permission, link = match_permission.groups()[:2]
@@ -3,6 +3,12 @@ from typing import Any
 
 import mkdocs_gen_files
 import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pyyaml was built without libyaml
+    from yaml import SafeLoader
+
 from cli_gen import generate_cli_doc
 
 FILENAME = "cli.md"
@@ -26,7 +32,7 @@ VERSION_DISCLAIMER = """
 
 with mkdocs_gen_files.open(FILENAME, "w") as io_doc:
     options_versions = Path(__file__).parent / "cli.yml"
-    versions: dict[str, Any] = yaml.safe_load(options_versions.read_bytes())
+    versions: dict[str, Any] = yaml.load(options_versions.read_bytes(), SafeLoader)
 
     print("# Command Line Interface\n", file=io_doc)
     print(VERSION_DISCLAIMER, file=io_doc)
@@ -1,5 +1,6 @@
 import re
-from subprocess import run
+from subprocess import PIPE, CalledProcessError, Popen
+from typing import Iterator
 
 import mkdocs_gen_files
 
@@ -39,6 +40,11 @@ SELF_DEP = re.compile(
     r"(\| \[(?:cpp-linter|clang-tools-manager) v[0-9.]+[^\s]*)[^\]]+(\]\(.*)$"
 )
 
+# cheap prefix test to skip the SELF_DEP regex on rows that cannot match it
+SELF_DEP_PREFIXES = ("| [cpp-linter v", "| [clang-tools-manager v")
+
+LICENSE_LINK = re.compile(r" (MIT|Apache-2\.0|MPL-2\.0|GPL-3\.0)\b")
+
 
 class TreeGetter:
     def __init__(self):
@@ -60,44 +66,36 @@ class TreeGetter:
     def package(self, value: str) -> None:
         self.args[7] = value
 
-    def get_output(self) -> str:
-        output = run(
-            self.args,
-            capture_output=True,
-            check=True,
-        )
-        result = []
-        for line in output.stdout.decode(encoding="utf-8").splitlines()[1:]:
-            dep = (
-                line[3:]
-                .replace(" MIT", " [MIT]")
-                .replace(" Apache-2.0", " [Apache-2.0]")
-                .replace(" MPL-2.0", " [MPL-2.0]")
-                .replace(" GPL-3.0", " [GPL-3.0]")
-                .strip()
-            )
-            self_match = SELF_DEP.match(dep)
-            if self_match is not None:
-                dep = SELF_DEP.sub(r"\1\2", dep)
-            result.append(dep)
-        return "\n".join(result)
+    def rows(self) -> Iterator[str]:
+        with Popen(self.args, stdout=PIPE, text=True, encoding="utf-8") as proc:
+            assert proc.stdout is not None
+            next(proc.stdout, None)  # the first row is the package itself
+            for line in proc.stdout:
+                dep = LICENSE_LINK.sub(r" [\1]", line[3:].strip())
+                if dep.startswith(SELF_DEP_PREFIXES):
+                    self_match = SELF_DEP.match(dep)
+                    if self_match is not None:
+                        dep = self_match.expand(r"\1\2")
+                yield dep
+        if proc.returncode:
+            raise CalledProcessError(proc.returncode, self.args)
+
+
+def write_deps(io_doc, header: str, tg: TreeGetter) -> None:
+    io_doc.write(header)
+    for dep in tg.rows():
+        print(dep, file=io_doc)
 
 
 with mkdocs_gen_files.open(FILENAME, "w") as io_doc:
     tg = TreeGetter()
     print(INTRO, file=io_doc)
-    doc = CPP_LINTER_DEPS
-    doc += tg.get_output()
-    # print(doc)
-    print(doc, file=io_doc)
+    write_deps(io_doc, CPP_LINTER_DEPS, tg)
     tg.package("cpp-linter-py")
-    doc = tg.get_output()
-    print(f"\n{PY_BINDING_HEADER}{doc}", file=io_doc)
+    write_deps(io_doc, f"\n{PY_BINDING_HEADER}", tg)
     tg.package("cpp-linter-js")
-    doc = tg.get_output()
-    print(f"\n{JS_BINDING_HEADER}{doc}", file=io_doc)
+    write_deps(io_doc, f"\n{JS_BINDING_HEADER}", tg)
     tg.package("clang-tools-manager")
-    doc = tg.get_output()
-    print(f"\n{CLANG_INSTALLER_DEPS}{doc}", file=io_doc)
+    write_deps(io_doc, f"\n{CLANG_INSTALLER_DEPS}", tg)
 
 mkdocs_gen_files.set_edit_path(FILENAME, "license-gen.py")